@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""
+Numba kernels for overlap checks on large appointment lists.
+
+Optional: imported lazily by app.py, which falls back to NumPy / pure
+Python when Numba is not installed. All inputs are int64 epoch seconds,
+never datetime objects, so the kernels compile in nopython mode.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def first_overlap(starts, ends, ns, ne, max_durata):
+    """Index of the earliest interval overlapping [ns, ne), or -1.
+
+    starts must be sorted ascending and max_durata must be at least the
+    longest end - start; only starts in [ns - max_durata, ne) are scanned.
+    """
+    lo = np.searchsorted(starts, ns - max_durata)
+    hi = np.searchsorted(starts, ne)
+    for i in range(lo, hi):
+        if ends[i] > ns:
+            return i
+    return -1
+
+
+@njit(cache=True)
+def first_overlaps(starts, ends, new_starts, new_ends, max_durata):
+    """first_overlap for every (new_starts[k], new_ends[k]) pair."""
+    out = np.empty(new_starts.size, dtype=np.int64)
+    for k in range(new_starts.size):
+        out[k] = first_overlap(starts, ends, new_starts[k], new_ends[k], max_durata)
+    return out
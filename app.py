@@ -11,22 +11,61 @@ What's included:
 """
 
 import os
+import re
+import sys
 import json
+import bisect
+import functools
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime, timedelta
-from tkcalendar import DateEntry
+
+try:
+    import orjson  # optional, faster JSON encode/decode
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np  # optional, vectorized bulk overlap checks
+except ImportError:
+    np = None
+
+
+@functools.cache
+def _numba_first_overlaps():
+    """Numba bulk-overlap kernel, or None; numba is slow to import, so lazy."""
+    try:
+        from _kernels import first_overlaps
+    except ImportError:
+        return None
+    return first_overlaps
 
 
 # ------------------------ Domain model ------------------------
 
+# Naive wall-clock epoch: offsets from it ignore DST and timezones entirely
+_EPOCH = datetime(1970, 1, 1)
+
 class Appuntamento:
     """Lightweight appointment entity."""
 
+    __slots__ = ("titolo", "data_ora", "durata", "_start_ts", "_end_ts", "_display")
+
     def __init__(self, titolo: str, data_ora: datetime, durata_min: int):
-        self.titolo = titolo.strip()
+        # Interned: recurring titles ("Meeting", "Lezione") share one string
+        self.titolo = sys.intern(titolo.strip())
         self.data_ora = data_ora
         self.durata = int(durata_min)
+        # Wall-clock seconds since _EPOCH, cached for cheap integer comparisons
+        self._start_ts = (data_ora - _EPOCH) // timedelta(seconds=1)
+        self._end_ts = self._start_ts + self.durata * 60
+        # Appointments are never mutated, so the label can be built once
+        # Field formatting instead of strftime, which goes through libc
+        fine = self.fine
+        start = f"{data_ora.day:02d}/{data_ora.month:02d} {data_ora.hour:02d}:{data_ora.minute:02d}"
+        end = f"{fine.hour:02d}:{fine.minute:02d}"
+        self._display = f"{self.titolo} — {start} → {end} ({self.durata} min)"
 
     @property
     def fine(self) -> datetime:
@@ -51,9 +90,7 @@ class Appuntamento:
         )
 
     def __str__(self) -> str:
-        start = self.data_ora.strftime("%d/%m %H:%M")
-        end = self.fine.strftime("%H:%M")
-        return f"{self.titolo} — {start} → {end} ({self.durata} min)"
+        return self._display
 
 
 # ------------------------ Application ------------------------
@@ -62,6 +99,13 @@ class GestoreAppuntamenti(tk.Tk):
     """Main window and controller."""
 
     SAVE_FILE = "appointments.json"
+    SAVE_DELAY_MS = 500
+    SAVE_POLL_MS = 100
+    # Above this many appointments, bulk checks use the Numba kernel if present
+    NUMBA_THRESHOLD = 256
+    # HH:MM start options in 30-minute steps, built once at import
+    _TIME_SLOTS = tuple(f"{h:02d}:{m:02d}" for h in range(24) for m in (0, 30))
+    _TIME_RE = re.compile(r"^([01]\d|2[0-3]):([0-5]\d)$")
 
     def __init__(self):
         super().__init__()
@@ -70,10 +114,24 @@ class GestoreAppuntamenti(tk.Tk):
         self.minsize(460, 520)
 
         self.appuntamenti: list[Appuntamento] = []
+        # Sorted epoch-second bounds, kept parallel to self.appuntamenti.
+        # Plain lists on purpose: insert/del shift only pointers (a memmove),
+        # and bisect plus NumPy/Numba bulk checks need flat, indexable data.
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+        # Longest duration seen (seconds): bounds the backward overlap scan
+        self._max_durata = 0
+
+        # Debounced background persistence
+        self._save_pending: str | None = None
+        self._save_lock = threading.Lock()
+        self._save_gen = 0
+        self._saved_gen = 0
+        self._save_error: str | None = None
 
         self._build_ui()
         self._load()
-        self._refresh_list()
+        self._populate_list()
 
         # Save gracefully on close
         self.protocol("WM_DELETE_WINDOW", self._on_close)
@@ -89,19 +147,25 @@ class GestoreAppuntamenti(tk.Tk):
         frm.pack(fill=tk.X)
 
         ttk.Label(frm, text="Titolo:").grid(row=0, column=0, padx=6, pady=6, sticky="w")
-        self.ent_title = ttk.Entry(frm, width=34)
+        self._var_title = tk.StringVar(self)
+        self.ent_title = ttk.Entry(frm, textvariable=self._var_title, width=34)
         self.ent_title.grid(row=0, column=1, padx=6, pady=6, sticky="we", columnspan=2)
 
         ttk.Label(frm, text="Giorno:").grid(row=1, column=0, padx=6, pady=6, sticky="w")
+        # Deferred: tkcalendar pulls in babel, which is slow to import
+        from tkcalendar import DateEntry
         self.cal_date = DateEntry(frm, date_pattern="dd/mm/yyyy", width=12)
         self.cal_date.grid(row=1, column=1, padx=6, pady=6, sticky="w")
 
         ttk.Label(frm, text="Ora Inizio:").grid(row=2, column=0, padx=6, pady=6, sticky="w")
-        self.cmb_time = ttk.Combobox(frm, values=self._time_slots(), width=10, state="readonly")
+        self._var_time = tk.StringVar(self)
+        self.cmb_time = ttk.Combobox(frm, textvariable=self._var_time, values=self._TIME_SLOTS,
+                                     width=10, state="readonly")
         self.cmb_time.grid(row=2, column=1, padx=6, pady=6, sticky="w")
 
         ttk.Label(frm, text="Durata (minuti):").grid(row=3, column=0, padx=6, pady=6, sticky="w")
-        self.ent_duration = ttk.Entry(frm, width=12)
+        self._var_duration = tk.StringVar(self)
+        self.ent_duration = ttk.Entry(frm, textvariable=self._var_duration, width=12)
         self.ent_duration.grid(row=3, column=1, padx=6, pady=6, sticky="w")
 
         # Buttons
@@ -129,46 +193,85 @@ class GestoreAppuntamenti(tk.Tk):
 
     # ---------- Logic ----------
 
-    @staticmethod
-    def _time_slots(step_minutes: int = 30) -> list[str]:
-        """Generate HH:MM options by step."""
-        return [f"{h:02d}:{m:02d}" for h in range(24) for m in range(0, 60, step_minutes)]
-
     def _parse_form(self) -> Appuntamento | None:
         """Validate and convert form inputs into an Appuntamento."""
-        title = self.ent_title.get().strip()
-        time_str = self.cmb_time.get().strip()
-        duration_str = self.ent_duration.get().strip()
+        title = self._var_title.get().strip()
+        time_str = self._var_time.get().strip()
+        duration_str = self._var_duration.get().strip()
 
         if not title or not time_str or not duration_str:
             messagebox.showerror("Errore", "Compila tutti i campi!")
             return None
 
         try:
-            duration = int(duration_str)
-            if duration <= 0:
-                raise ValueError
+            # isdecimal() fast path; int() can still reject >4300-digit strings
+            duration = int(duration_str) if duration_str.isdecimal() else 0
         except ValueError:
+            duration = 0
+        if duration <= 0:
             messagebox.showerror("Errore", "La durata deve essere un intero positivo.")
             return None
 
+        m = self._TIME_RE.match(time_str)
+        if not m:
+            messagebox.showerror("Errore", "Formato data/ora non valido.")
+            return None
+        hh, mm = int(m.group(1)), int(m.group(2))
+
         try:
             # DateEntry returns a date; combine with selected time
             d = self.cal_date.get_date()
-            hh, mm = map(int, time_str.split(":"))
             start_dt = datetime(d.year, d.month, d.day, hh, mm)
         except Exception:
             messagebox.showerror("Errore", "Formato data/ora non valido.")
             return None
 
-        return Appuntamento(title, start_dt, duration)
+        try:
+            return Appuntamento(title, start_dt, duration)
+        except (ValueError, OverflowError):
+            # End time falls outside the datetime range
+            messagebox.showerror("Errore", "La durata è troppo grande.")
+            return None
 
     def _find_overlap(self, new_ap: Appuntamento) -> Appuntamento | None:
         """Return conflicting appointment if time windows overlap, else None."""
-        for ap in self.appuntamenti:
-            if (new_ap.data_ora < ap.fine) and (new_ap.fine > ap.data_ora):
-                return ap
-        return None
+        i = self._overlap_index(new_ap._start_ts, new_ap._end_ts)
+        return self.appuntamenti[i] if i >= 0 else None
+
+    def _overlap_index(self, ns: int, ne: int) -> int:
+        """Index of the earliest appointment overlapping [ns, ne), or -1."""
+        # Only appointments starting in [ns - longest duration, ne) can
+        # overlap; the first of them still running at ns is the earliest.
+        lo = bisect.bisect_left(self._starts, ns - self._max_durata)
+        hi = bisect.bisect_left(self._starts, ne)
+        for i in range(lo, hi):
+            if self._ends[i] > ns:
+                return i
+        return -1
+
+    def _bulk_find_overlaps(self, new_aps: list[Appuntamento]) -> list[int]:
+        """Conflict index (or -1) for each new appointment, e.g. for imports.
+
+        Only checks against the current list, not among new_aps themselves.
+        The earliest conflict is reported whatever the backend: large lists
+        go through the Numba kernel when available, others through a single
+        NumPy broadcast, and without NumPy one bisect lookup per item.
+        """
+        if np is None or not self._starts or not new_aps:
+            return [self._overlap_index(ap._start_ts, ap._end_ts) for ap in new_aps]
+
+        starts = np.asarray(self._starts, dtype=np.int64)
+        ends = np.asarray(self._ends, dtype=np.int64)
+        new_starts = np.fromiter((ap._start_ts for ap in new_aps), np.int64, len(new_aps))
+        new_ends = np.fromiter((ap._end_ts for ap in new_aps), np.int64, len(new_aps))
+
+        if len(self._starts) > self.NUMBA_THRESHOLD:
+            kernel = _numba_first_overlaps()
+            if kernel is not None:
+                return kernel(starts, ends, new_starts, new_ends, self._max_durata).tolist()
+
+        mask = (new_starts[:, None] < ends[None, :]) & (new_ends[:, None] > starts[None, :])
+        return np.where(mask.any(axis=1), mask.argmax(axis=1), -1).tolist()
 
     def _add_appointment(self) -> None:
         ap = self._parse_form()
@@ -179,16 +282,15 @@ class GestoreAppuntamenti(tk.Tk):
         conflict = self._find_overlap(ap)
         if conflict:
             msg = (f"Questo appuntamento si sovrappone a:\n"
-                   f"«{conflict.titolo} — {conflict.data_ora.strftime('%d/%m %H:%M')}».\n"
+                   f"«{conflict}».\n"
                    f"Vuoi aggiungerlo comunque?")
             if not messagebox.askyesno("Sovrapposizione", msg):
                 self.status.config(text="Aggiunta annullata (sovrapposizione).")
                 return
 
-        self.appuntamenti.append(ap)
-        self._refresh_list()
+        self._insert_row(ap)
         self._clear_form()
-        self._save()
+        self._schedule_save()
         self.status.config(text="Appuntamento aggiunto.")
 
     def _delete_selected(self) -> None:
@@ -199,45 +301,126 @@ class GestoreAppuntamenti(tk.Tk):
         idx = sel[0]
         ap = self.appuntamenti[idx]
         if messagebox.askyesno("Conferma", f"Cancellare «{ap.titolo}»?"):
-            del self.appuntamenti[idx]
-            self._refresh_list()
-            self._save()
+            self._remove_row(idx)
+            self._schedule_save()
             self.status.config(text="Appuntamento cancellato.")
 
-    def _refresh_list(self) -> None:
-        """Sort list and refresh the UI listbox."""
-        self.appuntamenti.sort(key=lambda a: a.data_ora)
+    def _populate_list(self) -> None:
+        """Fill the UI listbox with all appointments in a single call."""
         self.lst.delete(0, tk.END)
-        for ap in self.appuntamenti:
-            self.lst.insert(tk.END, str(ap))
+        if self.appuntamenti:
+            self.lst.insert(tk.END, *[str(ap) for ap in self.appuntamenti])
+
+    def _insert_row(self, ap: Appuntamento) -> int:
+        """Insert one appointment at its sorted position; return its index."""
+        idx = bisect.bisect_right(self._starts, ap._start_ts)
+        self._starts.insert(idx, ap._start_ts)
+        self._ends.insert(idx, ap._end_ts)
+        self._max_durata = max(self._max_durata, ap._end_ts - ap._start_ts)
+        self.appuntamenti.insert(idx, ap)
+        self.lst.insert(idx, str(ap))
+        return idx
+
+    def _remove_row(self, idx: int) -> None:
+        """Remove the appointment at idx from the model and the listbox."""
+        self.lst.delete(idx)
+        del self.appuntamenti[idx]
+        del self._starts[idx]
+        del self._ends[idx]
+
+    def _rebuild_index(self) -> None:
+        """Recompute the sorted start/end arrays from self.appuntamenti."""
+        self._starts = [ap._start_ts for ap in self.appuntamenti]
+        self._ends = [ap._end_ts for ap in self.appuntamenti]
+        self._max_durata = max((e - s for s, e in zip(self._starts, self._ends)), default=0)
 
     def _clear_form(self) -> None:
-        self.ent_title.delete(0, tk.END)
-        self.cmb_time.set("")
-        self.ent_duration.delete(0, tk.END)
+        self._var_title.set("")
+        self._var_time.set("")
+        self._var_duration.set("")
 
     # ---------- Persistence ----------
 
-    def _save(self) -> None:
+    def _schedule_save(self) -> None:
+        """Debounce saves: a burst of changes results in a single write."""
+        if self._save_pending is not None:
+            self.after_cancel(self._save_pending)
+        self._save_pending = self.after(self.SAVE_DELAY_MS, self._do_save_async)
+
+    def _snapshot(self) -> tuple[list[dict], int]:
+        """Serialize the current list on the UI thread, tagged with a generation."""
+        self._save_gen += 1
+        return [ap.to_dict() for ap in self.appuntamenti], self._save_gen
+
+    def _do_save_async(self) -> None:
+        self._save_pending = None
+        data, gen = self._snapshot()
+        thread = threading.Thread(target=self._write_json_bg, args=(data, gen), daemon=True)
+        thread.start()
+        self.after(self.SAVE_POLL_MS, self._poll_save, thread)
+
+    def _poll_save(self, thread: threading.Thread) -> None:
+        """Report a background write failure once the thread is done (UI thread)."""
+        if thread.is_alive():
+            self.after(self.SAVE_POLL_MS, self._poll_save, thread)
+            return
+        with self._save_lock:
+            msg, self._save_error = self._save_error, None
+        if msg:
+            self.status.config(text=msg)
+
+    def _write_json_bg(self, data: list[dict], gen: int) -> None:
+        # Never touch Tk from here: record the error for _poll_save instead
         try:
-            data = [ap.to_dict() for ap in self.appuntamenti]
-            with open(self.SAVE_FILE, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            self._write_json(data, gen)
         except Exception as e:
-            self.status.config(text=f"Errore salvataggio: {e}")
+            with self._save_lock:
+                self._save_error = f"Errore salvataggio: {e}"
+
+    def _write_json(self, data: list[dict], gen: int) -> None:
+        """Atomically replace SAVE_FILE, never overwriting a newer snapshot."""
+        with self._save_lock:
+            if gen <= self._saved_gen:
+                return
+            # Compact: the file is machine-read, indentation only adds bytes
+            if orjson is not None:
+                payload = orjson.dumps(data)
+            else:
+                payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            tmp = self.SAVE_FILE + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(payload)
+            os.replace(tmp, self.SAVE_FILE)
+            self._saved_gen = gen
 
     def _load(self) -> None:
         if not os.path.exists(self.SAVE_FILE):
             return
         try:
-            with open(self.SAVE_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            self.appuntamenti = [Appuntamento.from_dict(d) for d in data]
+            with open(self.SAVE_FILE, "rb") as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            # Inlined Appuntamento.from_dict: saves a call frame per entry
+            fromisoformat = datetime.fromisoformat
+            self.appuntamenti = [
+                Appuntamento(d["titolo"], fromisoformat(d["data_ora"]), d["durata"])
+                for d in data
+            ]
         except Exception as e:
             messagebox.showwarning("Avviso", f"Impossibile caricare i dati:\n{e}")
+        # File order is not trusted; from here on inserts keep the list sorted
+        self.appuntamenti.sort(key=lambda a: a._start_ts)
+        self._rebuild_index()
 
     def _on_close(self) -> None:
-        self._save()
+        # Flush synchronously: pending timers and daemon threads die with us
+        if self._save_pending is not None:
+            self.after_cancel(self._save_pending)
+            self._save_pending = None
+        try:
+            self._write_json(*self._snapshot())
+        except Exception as e:
+            messagebox.showerror("Errore", f"Errore salvataggio: {e}")
         self.destroy()
 
 
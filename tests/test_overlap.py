@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""Overlap lookups checked against a brute-force pairwise comparison."""
+
+import os
+import random
+import sys
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app
+from app import Appuntamento, GestoreAppuntamenti
+
+BASE = datetime(2026, 3, 1, 8, 0)
+
+
+def _random_ap(rng: random.Random, step: int, slots: int, durations: list[int]) -> Appuntamento:
+    return Appuntamento("x", BASE + timedelta(minutes=step * rng.randint(0, slots)),
+                        rng.choice(durations))
+
+
+def _scheduler(aps: list[Appuntamento]) -> GestoreAppuntamenti:
+    """Controller with only the model state set up (no Tk window)."""
+    g = GestoreAppuntamenti.__new__(GestoreAppuntamenti)
+    g.appuntamenti = sorted(aps, key=lambda a: a._start_ts)
+    g._rebuild_index()
+    return g
+
+
+def _earliest_conflict(aps: list[Appuntamento], new_ap: Appuntamento) -> int:
+    for i, ap in enumerate(aps):
+        if new_ap.data_ora < ap.fine and new_ap.fine > ap.data_ora:
+            return i
+    return -1
+
+
+class OverlapTest(unittest.TestCase):
+
+    def _check_bulk(self, n_existing: int, trials: int) -> None:
+        rng = random.Random(n_existing)
+        for _ in range(trials):
+            # Long durations make stored appointments overlap each other too
+            existing = [_random_ap(rng, 30, 4000, [15, 60, 600])
+                        for _ in range(rng.randint(0, n_existing))]
+            g = _scheduler(existing)
+            new_aps = [_random_ap(rng, 15, 8000, [30, 90]) for _ in range(rng.randint(0, 20))]
+            expected = [_earliest_conflict(g.appuntamenti, ap) for ap in new_aps]
+            self.assertEqual(g._bulk_find_overlaps(new_aps), expected)
+            for ap, i in zip(new_aps, expected):
+                self.assertIs(g._find_overlap(ap), g.appuntamenti[i] if i >= 0 else None)
+
+    def test_small_lists(self):
+        self._check_bulk(n_existing=20, trials=200)
+
+    def test_large_lists(self):
+        self._check_bulk(n_existing=2 * GestoreAppuntamenti.NUMBA_THRESHOLD, trials=10)
+
+    def test_bulk_without_numpy(self):
+        with mock.patch.object(app, "np", None):
+            self._check_bulk(n_existing=20, trials=100)
+
+    def test_touching_intervals_do_not_overlap(self):
+        g = _scheduler([Appuntamento("a", BASE, 60)])
+        self.assertIsNone(g._find_overlap(Appuntamento("b", BASE + timedelta(minutes=60), 30)))
+        self.assertIsNone(g._find_overlap(Appuntamento("c", BASE - timedelta(minutes=30), 30)))
+
+
+if __name__ == "__main__":
+    unittest.main()